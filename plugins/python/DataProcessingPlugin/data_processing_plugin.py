@@ -4,47 +4,179 @@ DataProcessing plugin for DevFlow - provides data manipulation and analysis capa
 Supports CSV, JSON, Excel file processing with data validation and transformation.
 """
 import sys
+import asyncio
 import json
 import os
+import hashlib
+import time
 import pandas as pd
 import numpy as np
 from datetime import datetime, timezone
 from typing import Dict, Any, List, Optional, Union
 from pathlib import Path
 import jsonschema
-from jsonschema import validate
 import shutil
+from collections import OrderedDict
+from itertools import islice
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+    from pyarrow import csv as pacsv
+except ImportError:  # pyarrow is optional; CSV reads fall back to pandas
+    pa = None
+    pc = None
+    pq = None
+    pacsv = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; JSON output falls back to pandas
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:  # xxhash is optional; schema fingerprints fall back to blake2b
+    xxhash = None
+
+try:
+    import numexpr  # noqa: F401
+    _QUERY_ENGINE = 'numexpr'
+except ImportError:  # numexpr is optional; queries fall back to the python engine
+    _QUERY_ENGINE = 'python'
+
+try:
+    import numba
+    _HAS_NUMBA = True
+except ImportError:  # numba is optional; aggregations use the default pandas engine
+    _HAS_NUMBA = False
+
+# Bytes handed to each Arrow CSV parsing block
+_ARROW_BLOCK_SIZE = 8 << 20
+
+# File formats inferred from extensions when none is given
+_READ_FORMATS = {'.csv': 'csv', '.json': 'json', '.xlsx': 'excel', '.xls': 'excel', '.parquet': 'parquet'}
+_WRITE_FORMATS = {'.csv': 'csv', '.json': 'json', '.xlsx': 'excel', '.parquet': 'parquet'}
+
+# Comparison operators that can be fused into a single DataFrame.query expression
+_QUERY_OPS = {'==': '==', '!=': '!=', '>': '>', '<': '<',
+              'equals': '==', 'not_equals': '!=', 'greater_than': '>', 'less_than': '<'}
+
+# Reducers pandas can JIT-compile for groupby.agg(engine='numba')
+_NUMBA_REDUCERS = frozenset({'sum', 'mean', 'min', 'max', 'std', 'var'})
+# Serial kernels: parallel ones started from a worker thread keep the process from exiting
+_NUMBA_ENGINE_KWARGS = {'nopython': True, 'parallel': False, 'nogil': True}
+
+# Reducers with hand-written kernels for single key, single column aggregations
+_GROUP_KERNEL_REDUCERS = frozenset({'sum', 'mean', 'min', 'max', 'count'})
+
+# Checked schema validators, keyed by a digest of the canonical schema JSON
+_VALIDATOR_CACHE: 'OrderedDict[str, Any]' = OrderedDict()
+_VALIDATOR_CACHE_SIZE = 128
+
+# Keywords that only constrain arrays; a schema using them describes the whole dataset
+_ARRAY_SCHEMA_KEYWORDS = frozenset({
+    'items', 'prefixItems', 'additionalItems', 'unevaluatedItems', 'contains',
+    'minContains', 'maxContains', 'minItems', 'maxItems', 'uniqueItems'
+})
+
+def _is_record_schema(schema: Dict[str, Any]) -> bool:
+    """Whether a schema clearly describes a single record rather than the list of records."""
+    if schema.get('type') == 'object':
+        return True
+    return ('properties' in schema or 'required' in schema) and _ARRAY_SCHEMA_KEYWORDS.isdisjoint(schema)
+
+def _json_default(value: Any) -> Any:
+    """Encode pandas scalars orjson does not know about."""
+    if value is pd.NaT or value is pd.NA:
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f'Type is not JSON serializable: {type(value).__name__}')
+
+if _HAS_NUMBA:
+    # Group kernels scatter into per-group slots, so the loops stay serial; cache=True
+    # keeps the compiled code on disk across plugin processes.
+    @numba.njit(cache=True, nogil=True)
+    def _group_sum(codes, values, ngroups):
+        """Sum values per group code, skipping NaN values and null (-1) codes."""
+        out = np.zeros(ngroups, values.dtype)
+        for i in range(codes.shape[0]):
+            code = codes[i]
+            value = values[i]
+            if code >= 0 and value == value:
+                out[code] += value
+        return out
+    
+    @numba.njit(cache=True, nogil=True)
+    def _group_count(codes, values, ngroups):
+        """Count non-NaN values per group code."""
+        out = np.zeros(ngroups, np.int64)
+        for i in range(codes.shape[0]):
+            code = codes[i]
+            if code >= 0 and values[i] == values[i]:
+                out[code] += 1
+        return out
+    
+    @numba.njit(cache=True, nogil=True)
+    def _group_min(codes, values, ngroups):
+        """Minimum per group code, with a flag for groups that had no non-NaN value."""
+        out = np.zeros(ngroups, values.dtype)
+        seen = np.zeros(ngroups, np.bool_)
+        for i in range(codes.shape[0]):
+            code = codes[i]
+            value = values[i]
+            if code >= 0 and value == value and (not seen[code] or value < out[code]):
+                out[code] = value
+                seen[code] = True
+        return out, seen
+    
+    @numba.njit(cache=True, nogil=True)
+    def _group_max(codes, values, ngroups):
+        """Maximum per group code, with a flag for groups that had no non-NaN value."""
+        out = np.zeros(ngroups, values.dtype)
+        seen = np.zeros(ngroups, np.bool_)
+        for i in range(codes.shape[0]):
+            code = codes[i]
+            value = values[i]
+            if code >= 0 and value == value and (not seen[code] or value > out[code]):
+                out[code] = value
+                seen[code] = True
+        return out, seen
 
 class DataProcessingPlugin:
     """Data processing plugin for DevFlow runtime."""
     
     def __init__(self):
         self.logs = []
-        self.start_time = datetime.now(timezone.utc)
+        self.start_time = time.perf_counter_ns()
         self.config = {}
         self.working_directory = os.getcwd()
+        self._log_enabled = False
     
     async def execute_async(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Main plugin execution method called by DevFlow runtime."""
-        self.start_time = datetime.now(timezone.utc)
+        self.start_time = time.perf_counter_ns()
         self.logs = []
         
         try:
-            self._log('DataProcessing plugin execution started')
-            
-            # Parse context and configuration
+            # Parse context and configuration; logging stays off until logLevel is known
             self._parse_context(context)
+            self._log('DataProcessing plugin execution started')
             
             # Get the operation to perform
             operation = self._get_operation(context)
             
-            self._log(f'Performing {operation["type"]} operation')
+            self._log('Performing %s operation', operation['type'])
             
             # Execute the requested operation
             result = await self._perform_operation(operation)
             
-            execution_time = (datetime.now(timezone.utc) - self.start_time).total_seconds() * 1000
-            self._log(f'Operation completed in {execution_time:.2f}ms')
+            execution_time = (time.perf_counter_ns() - self.start_time) / 1e6
+            self._log('Operation completed in %.2fms', execution_time)
             
             return {
                 'success': True,
@@ -56,9 +188,9 @@ class DataProcessingPlugin:
             }
             
         except Exception as error:
-            execution_time = (datetime.now(timezone.utc) - self.start_time).total_seconds() * 1000
+            execution_time = (time.perf_counter_ns() - self.start_time) / 1e6
             error_message = str(error)
-            self._log(f'Error: {error_message}')
+            self._log('Error: %s', error_message)
             
             return {
                 'success': False,
@@ -79,14 +211,20 @@ class DataProcessingPlugin:
             'validateData': True,
             'createBackups': True,
             'logLevel': 'info',
+            'fastIO': 'arrow',
+            'optimizeDtypes': False,
+            'aggregationEngine': 'cython',
+            'maxErrors': 1000,
             **(context.get('configuration', {}) or context.get('executionParameters', {}))
         }
         
+        self._log_enabled = self.config.get('logLevel') in ['debug', 'info']
+        
         # Set working directory
         self.working_directory = context.get('workingDirectory', os.getcwd())
         
-        self._log(f'Configuration loaded - Working directory: {self.working_directory}')
-        self._log(f'Max records: {self.config["maxRecords"]}')
+        self._log('Configuration loaded - Working directory: %s', self.working_directory)
+        self._log('Max records: %s', self.config['maxRecords'])
     
     def _get_operation(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Extract operation details from context."""
@@ -139,33 +277,29 @@ class DataProcessingPlugin:
         """Read data from file."""
         full_path = os.path.join(self.working_directory, file_path)
         
-        if not os.path.exists(full_path):
-            raise FileNotFoundError(f'File not found: {full_path}')
+        # One stat serves the existence check and the reported size
+        try:
+            stat = os.stat(full_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f'File not found: {full_path}') from None
         
         # Determine format from extension if not specified
         if not format_type:
-            ext = Path(full_path).suffix.lower()
-            format_map = {'.csv': 'csv', '.json': 'json', '.xlsx': 'excel', '.xls': 'excel'}
-            format_type = format_map.get(ext, 'csv')
+            format_type = _READ_FORMATS.get(Path(full_path).suffix.lower(), 'csv')
         
-        self._log(f'Reading {format_type} file: {full_path}')
+        self._log('Reading %s file: %s', format_type, full_path)
         
-        if format_type == 'csv':
-            df = pd.read_csv(full_path, encoding=self.config['encoding'])
-        elif format_type == 'json':
-            df = pd.read_json(full_path, encoding=self.config['encoding'])
-        elif format_type == 'excel':
-            df = pd.read_excel(full_path)
-        else:
-            raise ValueError(f'Unsupported format: {format_type}')
+        # Parse one row past the limit so truncation is detected without reading the rest
+        max_records = self.config['maxRecords']
+        df = await asyncio.to_thread(self._load_df, full_path, format_type, max_records + 1)
         
         # Check record limit
-        if len(df) > self.config['maxRecords']:
-            self._log(f'Warning: File has {len(df)} records, truncating to {self.config["maxRecords"]}')
-            df = df.head(self.config['maxRecords'])
+        if len(df) > max_records:
+            self._log('Warning: File has more than %s records, truncating to %s', max_records, max_records)
+            df = df.head(max_records)
         
-        file_size = os.path.getsize(full_path)
-        self._log(f'Read {len(df)} records from {full_path} ({file_size} bytes)')
+        file_size = stat.st_size
+        self._log('Read %d records from %s (%d bytes)', len(df), full_path, file_size)
         
         return {
             'filePath': full_path,
@@ -173,7 +307,7 @@ class DataProcessingPlugin:
             'records': len(df),
             'columns': list(df.columns),
             'size': file_size,
-            'preview': df.head(5).to_dict('records'),
+            'preview': self._preview(df),
             'dataTypes': {col: str(dtype) for col, dtype in df.dtypes.items()},
             'summary': self._get_summary_stats(df)
         }
@@ -183,10 +317,13 @@ class DataProcessingPlugin:
         full_path = os.path.join(self.working_directory, output_path)
         
         # Create backup if file exists
-        if self.config['createBackups'] and os.path.exists(full_path):
+        if self.config['createBackups']:
             backup_path = f'{full_path}.backup.{int(datetime.now().timestamp())}'
-            shutil.copy2(full_path, backup_path)
-            self._log(f'Created backup: {backup_path}')
+            try:
+                await asyncio.to_thread(shutil.copy2, full_path, backup_path)
+                self._log('Created backup: %s', backup_path)
+            except FileNotFoundError:
+                pass
         
         # Convert data to DataFrame if needed
         if isinstance(data, dict):
@@ -195,31 +332,24 @@ class DataProcessingPlugin:
             df = pd.DataFrame(data)
         elif isinstance(data, pd.DataFrame):
             df = data
+        elif pa is not None and isinstance(data, pa.Table):
+            df = data
         else:
-            raise ValueError('Data must be dict, list, or DataFrame')
+            raise ValueError('Data must be dict, list, DataFrame, or Arrow table')
         
         # Determine format from extension if not specified
         if not format_type:
-            ext = Path(full_path).suffix.lower()
-            format_map = {'.csv': 'csv', '.json': 'json', '.xlsx': 'excel'}
-            format_type = format_map.get(ext, 'csv')
+            format_type = _WRITE_FORMATS.get(Path(full_path).suffix.lower(), 'csv')
         
         # Ensure directory exists
         os.makedirs(os.path.dirname(full_path), exist_ok=True)
         
-        self._log(f'Writing {len(df)} records to {full_path} as {format_type}')
+        self._log('Writing %d records to %s as %s', len(df), full_path, format_type)
         
-        if format_type == 'csv':
-            df.to_csv(full_path, index=False, encoding=self.config['encoding'])
-        elif format_type == 'json':
-            df.to_json(full_path, orient='records', indent=2)
-        elif format_type == 'excel':
-            df.to_excel(full_path, index=False)
-        else:
-            raise ValueError(f'Unsupported format: {format_type}')
+        await asyncio.to_thread(self._write_file, df, full_path, format_type)
         
         file_size = os.path.getsize(full_path)
-        self._log(f'Wrote {len(df)} records to {full_path} ({file_size} bytes)')
+        self._log('Wrote %d records to %s (%d bytes)', len(df), full_path, file_size)
         
         return {
             'filePath': full_path,
@@ -231,44 +361,46 @@ class DataProcessingPlugin:
     async def _transform_data(self, file_path: str, transformations: List[Dict], output_path: Optional[str] = None) -> Dict[str, Any]:
         """Apply transformations to data."""
         full_path = os.path.join(self.working_directory, file_path)
-        df = pd.read_csv(full_path, encoding=self.config['encoding'])
+        df = await asyncio.to_thread(self._load_df, full_path)
         
         original_records = len(df)
-        self._log(f'Applying {len(transformations)} transformations to {original_records} records')
+        self._log('Applying %d transformations to %d records', len(transformations), original_records)
         
+        # Consecutive filter_rows transforms are collected and applied as one query
+        pending_filters = []
         for i, transform in enumerate(transformations):
             transform_type = transform.get('type')
-            self._log(f'Applying transformation {i+1}: {transform_type}')
+            self._log('Applying transformation %d: %s', i + 1, transform_type)
+            
+            if transform_type == 'filter_rows':
+                if transform['operator'] in _QUERY_OPS:
+                    pending_filters.append((transform['column'], transform['operator'], transform['value']))
+                continue
+            
+            if pending_filters:
+                df = self._apply_conditions(df, pending_filters)
+                pending_filters = []
             
             if transform_type == 'rename_column':
                 df = df.rename(columns={transform['from']: transform['to']})
-            elif transform_type == 'filter_rows':
-                column = transform['column']
-                operator = transform['operator']
-                value = transform['value']
-                if operator == '==':
-                    df = df[df[column] == value]
-                elif operator == '!=':
-                    df = df[df[column] != value]
-                elif operator == '>':
-                    df = df[df[column] > value]
-                elif operator == '<':
-                    df = df[df[column] < value]
             elif transform_type == 'add_column':
-                df[transform['name']] = transform.get('value', '')
+                df = df.assign(**{transform['name']: transform.get('value', '')})
             elif transform_type == 'remove_column':
                 df = df.drop(columns=[transform['column']])
             elif transform_type == 'sort':
                 df = df.sort_values(by=transform['column'], ascending=transform.get('ascending', True))
         
+        if pending_filters:
+            df = self._apply_conditions(df, pending_filters)
+        
         final_records = len(df)
-        self._log(f'Transformations complete: {original_records} -> {final_records} records')
+        self._log('Transformations complete: %d -> %d records', original_records, final_records)
         
         result = {
             'originalRecords': original_records,
             'finalRecords': final_records,
             'transformationsApplied': len(transformations),
-            'preview': df.head(5).to_dict('records')
+            'preview': self._preview(df)
         }
         
         if output_path:
@@ -280,7 +412,8 @@ class DataProcessingPlugin:
     async def _validate_data(self, file_path: str, schema: Optional[Dict] = None) -> Dict[str, Any]:
         """Validate data against schema."""
         full_path = os.path.join(self.working_directory, file_path)
-        df = pd.read_csv(full_path, encoding=self.config['encoding'])
+        df = await asyncio.to_thread(self._load_df, full_path)
+        null_counts = df.isnull().sum()
         
         validation_results = {
             'valid': True,
@@ -288,12 +421,12 @@ class DataProcessingPlugin:
             'warnings': [],
             'summary': {
                 'totalRecords': len(df),
-                'nullValues': df.isnull().sum().sum(),
+                'nullValues': null_counts.sum(),
                 'duplicateRows': df.duplicated().sum()
             }
         }
         
-        self._log(f'Validating {len(df)} records')
+        self._log('Validating %d records', len(df))
         
         # Basic validation
         if df.empty:
@@ -301,57 +434,77 @@ class DataProcessingPlugin:
             validation_results['valid'] = False
         
         # Check for null values
-        null_counts = df.isnull().sum()
-        for col, count in null_counts.items():
-            if count > 0:
-                validation_results['warnings'].append(f'Column {col} has {count} null values')
+        columns_with_nulls = null_counts[null_counts > 0]
+        validation_results['warnings'].extend(
+            f'Column {col} has {count} null values' for col, count in columns_with_nulls.items()
+        )
         
         # Schema validation if provided
         if schema:
-            try:
-                data_dict = df.to_dict('records')
-                validate(instance=data_dict, schema=schema)
-                self._log('Schema validation passed')
-            except jsonschema.exceptions.ValidationError as e:
-                validation_results['errors'].append(f'Schema validation failed: {e.message}')
+            validator = self._get_validator(schema)
+            
+            if _is_record_schema(schema):
+                # Schema describes a single record; check rows one at a time
+                columns = list(df.columns)
+                errors = (
+                    f'Schema validation failed for record {index}: {error.message}'
+                    for index, row in enumerate(df.itertuples(index=False, name=None))
+                    for error in validator.iter_errors(dict(zip(columns, row)))
+                )
+            else:
+                # Anything else is checked against the whole dataset, as a list of records
+                errors = (
+                    f'Schema validation failed: {error.message}'
+                    for error in validator.iter_errors(df.to_dict('records'))
+                )
+            
+            # Errors are generated lazily, so validation stops once the cap is reached;
+            # the data is invalid even when the cap (e.g. maxErrors: 0) hides every error
+            max_errors = max(self.config['maxErrors'], 0)
+            schema_errors = list(islice(errors, max_errors + 1))
+            if schema_errors:
                 validation_results['valid'] = False
+                if len(schema_errors) > max_errors:
+                    del schema_errors[max_errors:]
+                    validation_results['warnings'].append(f'Schema validation stopped after {max_errors} errors')
+                validation_results['errors'].extend(schema_errors)
+            else:
+                self._log('Schema validation passed')
         
-        self._log(f'Validation complete: {"PASSED" if validation_results["valid"] else "FAILED"}')
+        self._log('Validation complete: %s', 'PASSED' if validation_results['valid'] else 'FAILED')
         
         return validation_results
     
     async def _analyze_data(self, file_path: str) -> Dict[str, Any]:
         """Perform statistical analysis on data."""
         full_path = os.path.join(self.working_directory, file_path)
-        df = pd.read_csv(full_path, encoding=self.config['encoding'])
+        df = await asyncio.to_thread(self._load_df, full_path)
+        
+        self._log('Analyzing %d records with %d columns', len(df), len(df.columns))
         
-        self._log(f'Analyzing {len(df)} records with {len(df.columns)} columns')
+        # Null and duplicate scans are shared with the summary rather than repeated
+        null_counts = df.isnull().sum()
+        duplicate_count = int(df.duplicated().sum())
         
         analysis = {
             'shape': df.shape,
             'columns': list(df.columns),
             'dataTypes': {col: str(dtype) for col, dtype in df.dtypes.items()},
-            'summary': self._get_summary_stats(df),
-            'nullCounts': df.isnull().sum().to_dict(),
-            'duplicateCount': int(df.duplicated().sum()),
+            'summary': self._get_summary_stats(df, null_counts, duplicate_count),
+            'nullCounts': null_counts.to_dict(),
+            'duplicateCount': duplicate_count,
             'memoryUsage': df.memory_usage(deep=True).sum()
         }
         
-        # Numeric columns analysis
-        numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+        # Numeric columns analysis, all statistics in one aggregation
+        numeric_cols, text_cols = self._split_columns(df)
         if numeric_cols:
-            analysis['numericAnalysis'] = {
-                col: {
-                    'mean': float(df[col].mean()),
-                    'median': float(df[col].median()),
-                    'std': float(df[col].std()),
-                    'min': float(df[col].min()),
-                    'max': float(df[col].max())
-                } for col in numeric_cols
-            }
+            analysis['numericAnalysis'] = (
+                df[numeric_cols].agg(['mean', 'median', 'std', 'min', 'max']).astype(float).to_dict()
+            )
         
         # Categorical columns analysis
-        categorical_cols = df.select_dtypes(include=['object']).columns.tolist()
+        categorical_cols = text_cols
         if categorical_cols:
             analysis['categoricalAnalysis'] = {
                 col: {
@@ -367,36 +520,40 @@ class DataProcessingPlugin:
     async def _filter_data(self, file_path: str, filters: Dict, output_path: Optional[str] = None) -> Dict[str, Any]:
         """Filter data based on criteria."""
         full_path = os.path.join(self.working_directory, file_path)
-        df = pd.read_csv(full_path, encoding=self.config['encoding'])
+        df = await asyncio.to_thread(self._load_df, full_path)
         
         original_count = len(df)
-        self._log(f'Filtering {original_count} records with {len(filters)} filters')
+        self._log('Filtering %d records with %d filters', original_count, len(filters))
         
+        # Comparisons are evaluated as one expression; substring matches use Arrow kernels
+        conditions = []
+        contains = []
         for column, criteria in filters.items():
             if column in df.columns:
                 if isinstance(criteria, dict):
                     for operator, value in criteria.items():
-                        if operator == 'equals':
-                            df = df[df[column] == value]
-                        elif operator == 'not_equals':
-                            df = df[df[column] != value]
-                        elif operator == 'greater_than':
-                            df = df[df[column] > value]
-                        elif operator == 'less_than':
-                            df = df[df[column] < value]
-                        elif operator == 'contains':
-                            df = df[df[column].str.contains(str(value), na=False)]
+                        if operator == 'contains':
+                            contains.append((column, value))
+                        elif operator in _QUERY_OPS:
+                            conditions.append((column, operator, value))
                 else:
-                    df = df[df[column] == criteria]
+                    conditions.append((column, '==', criteria))
+        
+        # Every criterion is ANDed into one mask so the frame is copied once
+        if conditions or contains:
+            mask = self._conditions_mask(df, conditions) if conditions else np.ones(len(df), dtype=bool)
+            for column, value in contains:
+                mask &= np.asarray(self._contains_mask(df[column], str(value)), dtype=bool)
+            df = df[mask]
         
         filtered_count = len(df)
-        self._log(f'Filtering complete: {original_count} -> {filtered_count} records')
+        self._log('Filtering complete: %d -> %d records', original_count, filtered_count)
         
         result = {
             'originalRecords': original_count,
             'filteredRecords': filtered_count,
             'filtersApplied': len(filters),
-            'preview': df.head(5).to_dict('records')
+            'preview': self._preview(df)
         }
         
         if output_path:
@@ -408,7 +565,7 @@ class DataProcessingPlugin:
     async def _aggregate_data(self, file_path: str, aggregations: Dict, output_path: Optional[str] = None) -> Dict[str, Any]:
         """Aggregate data using group by operations."""
         full_path = os.path.join(self.working_directory, file_path)
-        df = pd.read_csv(full_path, encoding=self.config['encoding'])
+        df = await asyncio.to_thread(self._load_df, full_path)
         
         group_by = aggregations.get('groupBy', [])
         functions = aggregations.get('functions', {})
@@ -416,23 +573,35 @@ class DataProcessingPlugin:
         if not group_by:
             raise ValueError('groupBy columns must be specified for aggregation')
         
-        self._log(f'Aggregating {len(df)} records by {group_by}')
+        self._log('Aggregating %d records by %s', len(df), group_by)
         
         # Perform aggregation
-        agg_df = df.groupby(group_by).agg(functions).reset_index()
+        grouped = df.groupby(group_by)
+        agg_df = None
+        if self.config.get('aggregationEngine') == 'numba':
+            agg_df = await asyncio.to_thread(self._group_kernel_aggregate, df, group_by, functions)
+        
+        if agg_df is not None:
+            self._log('Using compiled single-column group kernel')
+        elif self._use_numba_engine(df, functions):
+            self._log('Using numba aggregation engine')
+            agg_df = await asyncio.to_thread(grouped.agg, functions, engine='numba', engine_kwargs=_NUMBA_ENGINE_KWARGS)
+        else:
+            agg_df = await asyncio.to_thread(grouped.agg, functions)
+        agg_df = agg_df.reset_index()
         
         # Flatten column names if they're multi-level
         if isinstance(agg_df.columns, pd.MultiIndex):
             agg_df.columns = ['_'.join(col).strip() for col in agg_df.columns]
         
-        self._log(f'Aggregation complete: {len(df)} -> {len(agg_df)} records')
+        self._log('Aggregation complete: %d -> %d records', len(df), len(agg_df))
         
         result = {
             'originalRecords': len(df),
             'aggregatedRecords': len(agg_df),
             'groupByColumns': group_by,
             'aggregationFunctions': functions,
-            'preview': agg_df.head(10).to_dict('records')
+            'preview': self._preview(agg_df, 10)
         }
         
         if output_path:
@@ -443,42 +612,361 @@ class DataProcessingPlugin:
     
     async def _convert_format(self, file_path: str, output_path: str, target_format: str) -> Dict[str, Any]:
         """Convert data between formats."""
-        # Read data
-        read_result = await self._read_data(file_path)
-        
-        # Re-read as DataFrame for conversion
         full_path = os.path.join(self.working_directory, file_path)
-        df = pd.read_csv(full_path, encoding=self.config['encoding'])
+        if not os.path.exists(full_path):
+            raise FileNotFoundError(f'File not found: {full_path}')
+        
+        # Read the full source once; the read operation's preview and summary are not needed here
+        source_format = _READ_FORMATS.get(Path(full_path).suffix.lower(), 'csv')
+        self._log('Reading %s file: %s', source_format, full_path)
+        if self._can_convert_in_arrow(source_format, target_format or _WRITE_FORMATS.get(Path(output_path).suffix.lower(), 'csv')):
+            # Arrow reads and writes these formats itself, so the data never becomes a DataFrame
+            df = await asyncio.to_thread(self._read_table, full_path, source_format)
+        else:
+            df = await asyncio.to_thread(self._load_df, full_path, source_format)
         
         # Write in new format
         write_result = await self._write_data(df, output_path, target_format)
         
-        self._log(f'Format conversion complete: {read_result["format"]} -> {target_format}')
+        self._log('Format conversion complete: %s -> %s', source_format, target_format)
         
         return {
-            'sourceFormat': read_result['format'],
+            'sourceFormat': source_format,
             'targetFormat': target_format,
             'records': len(df),
-            'sourceFile': read_result['filePath'],
+            'sourceFile': full_path,
             'targetFile': write_result['filePath']
         }
     
-    def _get_summary_stats(self, df: pd.DataFrame) -> Dict[str, Any]:
-        """Get summary statistics for DataFrame."""
+    def _get_validator(self, schema: Dict) -> Any:
+        """Return a checked validator for a schema, reusing one built for an identical schema."""
+        canonical = json.dumps(schema, sort_keys=True, separators=(',', ':')).encode('utf-8')
+        if xxhash is not None:
+            key = xxhash.xxh3_128_hexdigest(canonical)
+        else:
+            key = hashlib.blake2b(canonical).hexdigest()
+        
+        validator = _VALIDATOR_CACHE.get(key)
+        if validator is not None:
+            _VALIDATOR_CACHE.move_to_end(key)
+        else:
+            validator_class = jsonschema.validators.validator_for(schema)
+            validator_class.check_schema(schema)
+            validator = validator_class(schema)
+            _VALIDATOR_CACHE[key] = validator
+            if len(_VALIDATOR_CACHE) > _VALIDATOR_CACHE_SIZE:
+                _VALIDATOR_CACHE.popitem(last=False)
+        return validator
+    
+    def _load_df(self, full_path: str, format_type: Optional[str] = None, nrows: Optional[int] = None) -> pd.DataFrame:
+        """Load a data file into a DataFrame."""
+        if not format_type:
+            format_type = _READ_FORMATS.get(Path(full_path).suffix.lower(), 'csv')
+        
+        df = self._parse_file(full_path, format_type, nrows)
+        if self.config.get('optimizeDtypes'):
+            df = self._optimize_dtypes(df)
+        
+        return df
+    
+    def _write_file(self, df: Any, full_path: str, format_type: str) -> None:
+        """Serialize a DataFrame or Arrow table to disk in the given format."""
+        if pa is not None and isinstance(df, pa.Table):
+            self._write_table(df, full_path, format_type)
+        elif format_type == 'csv':
+            df.to_csv(full_path, index=False, encoding=self.config['encoding'])
+        elif format_type == 'json':
+            if orjson is not None:
+                with open(full_path, 'wb') as f:
+                    f.write(orjson.dumps(
+                        df.to_dict('records'),
+                        default=_json_default,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                    ))
+            else:
+                df.to_json(full_path, orient='records', indent=2)
+        elif format_type == 'excel':
+            df.to_excel(full_path, index=False)
+        elif format_type == 'parquet':
+            df.to_parquet(full_path, engine='pyarrow', compression='zstd', index=False)
+        else:
+            raise ValueError(f'Unsupported format: {format_type}')
+    
+    def _can_convert_in_arrow(self, source_format: str, target_format: str) -> bool:
+        """Check whether a conversion can stay in Arrow from read to write."""
+        if pa is None or self.config.get('fastIO') != 'arrow' or source_format not in ('csv', 'parquet'):
+            return False
+        # CSV targets stay on pandas: Arrow's writer quotes every string and spells
+        # booleans true/false, so its output would not match to_csv's dialect
+        if target_format == 'json':
+            return orjson is not None
+        return target_format == 'parquet'
+    
+    def _read_table(self, full_path: str, format_type: str) -> 'pa.Table':
+        """Read a CSV or Parquet file into an Arrow table."""
+        if format_type == 'parquet':
+            return pq.read_table(full_path)
+        return self._read_csv_table(full_path)
+    
+    def _write_table(self, table: 'pa.Table', full_path: str, format_type: str) -> None:
+        """Serialize an Arrow table with Arrow's own writers."""
+        if format_type == 'parquet':
+            pq.write_table(table, full_path, compression='zstd')
+        elif format_type == 'json':
+            with open(full_path, 'wb') as f:
+                f.write(orjson.dumps(table.to_pylist(), default=_json_default, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            raise ValueError(f'Unsupported format: {format_type}')
+    
+    def _parse_file(self, full_path: str, format_type: str, nrows: Optional[int] = None) -> pd.DataFrame:
+        """Parse a data file, using the Arrow CSV reader when available and stopping after nrows rows if given."""
+        if format_type == 'csv':
+            if pacsv is not None and self.config.get('fastIO') == 'arrow':
+                try:
+                    return self._read_csv_arrow(full_path, nrows)
+                except pa.ArrowInvalid:
+                    # Streamed blocks infer types from the first block only; let pandas retry those
+                    if nrows is None:
+                        raise
+            return pd.read_csv(full_path, encoding=self.config['encoding'], nrows=nrows)
+        elif format_type == 'json':
+            return pd.read_json(full_path, encoding=self.config['encoding'])
+        elif format_type == 'excel':
+            return pd.read_excel(full_path, nrows=nrows)
+        elif format_type == 'parquet':
+            return pd.read_parquet(full_path, engine='pyarrow')
+        else:
+            raise ValueError(f'Unsupported format: {format_type}')
+    
+    def _read_csv_arrow(self, full_path: str, nrows: Optional[int] = None) -> pd.DataFrame:
+        """Parse a CSV file with pyarrow and hand the columns over to pandas."""
+        table = self._read_csv_table(full_path, nrows)
+        return table.to_pandas(self_destruct=True, split_blocks=True)
+    
+    def _read_csv_table(self, full_path: str, nrows: Optional[int] = None) -> 'pa.Table':
+        """Parse a CSV file into an Arrow table, stopping after nrows rows if given."""
+        read_options = pacsv.ReadOptions(block_size=_ARROW_BLOCK_SIZE, encoding=self.config['encoding'])
+        convert_options = pacsv.ConvertOptions(strings_can_be_null=True)
+        
+        # pandas leaves dates and times as text; read any column Arrow would infer as
+        # temporal (judged from the first block) as a string so the source text survives
+        with pacsv.open_csv(full_path, read_options=read_options, convert_options=convert_options) as reader:
+            temporal = {field.name: pa.string() for field in reader.schema if pa.types.is_temporal(field.type)}
+        if temporal:
+            convert_options = pacsv.ConvertOptions(strings_can_be_null=True, column_types=temporal)
+        
+        if nrows is None:
+            table = pacsv.read_csv(full_path, read_options=read_options, convert_options=convert_options)
+        else:
+            # Stream blocks and stop as soon as enough rows have been parsed
+            batches = []
+            row_count = 0
+            with pacsv.open_csv(full_path, read_options=read_options, convert_options=convert_options) as reader:
+                for batch in reader:
+                    batches.append(batch)
+                    row_count += batch.num_rows
+                    if row_count >= nrows:
+                        break
+                table = pa.Table.from_batches(batches, schema=reader.schema).slice(0, nrows)
+        
+        return table
+    
+    def _optimize_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Shrink integer columns and store low-cardinality text columns as ordered categoricals.
+
+        Opt-in via optimizeDtypes: reported dataTypes change (e.g. int64 -> uint8, object -> category)
+        and integer group sums come back as unsigned when the source column was downcast.
+        """
+        converted = {}
+        for col in df.columns:
+            series = df[col]
+            if pd.api.types.is_integer_dtype(series.dtype) and len(series):
+                # Lossless only: floats keep float64 so statistics are unchanged
+                converted[col] = pd.to_numeric(series, downcast='unsigned' if series.min() >= 0 else 'integer')
+            elif pd.api.types.is_object_dtype(series.dtype) or pd.api.types.is_string_dtype(series.dtype):
+                if series.nunique(dropna=False) / max(len(series), 1) < 0.5:
+                    # Ordered by value so min/max and range comparisons behave as they do on text;
+                    # mixed-type columns (e.g. 'x' and 1) have no such order and stay as they are
+                    try:
+                        categories = sorted(series.dropna().unique())
+                    except TypeError:
+                        continue
+                    converted[col] = series.astype(pd.CategoricalDtype(categories, ordered=True))
+        
+        return df.assign(**converted) if converted else df
+    
+    def _apply_conditions(self, df: pd.DataFrame, conditions: List[tuple]) -> pd.DataFrame:
+        """Apply AND-ed (column, operator, value) comparisons with a single row selection."""
+        if not conditions:
+            return df
+        return df[self._conditions_mask(df, conditions)]
+    
+    def _conditions_mask(self, df: pd.DataFrame, conditions: List[tuple]) -> np.ndarray:
+        """Evaluate AND-ed (column, operator, value) comparisons into one boolean array; nulls never match."""
+        mask = np.ones(len(df), dtype=bool)
+        
+        # Categoricals are compared on their categories; the rest go into one expression
+        expression_conditions = []
+        for column, operator, value in conditions:
+            if column in df.columns and isinstance(df[column].dtype, pd.CategoricalDtype):
+                mask &= self._compare(df[column], _QUERY_OPS[operator], value)
+            else:
+                expression_conditions.append((column, operator, value))
+        if not expression_conditions:
+            return mask
+        
+        # Values are bound as local variables so they never need quoting in the expression
+        terms = []
+        local_dict = {}
+        for i, (column, operator, value) in enumerate(expression_conditions):
+            local_dict[f'_v{i}'] = value
+            terms.append(f'`{column}` {_QUERY_OPS[operator]} @_v{i}')
+        
+        # numexpr only handles NumPy-backed columns
+        engine = _QUERY_ENGINE
+        for column, _, _ in expression_conditions:
+            if column in df.columns and isinstance(df[column].dtype, pd.api.extensions.ExtensionDtype):
+                engine = 'python'
+                break
+        
+        try:
+            result = df.eval(' and '.join(terms), engine=engine, local_dict=local_dict)
+            mask &= result.to_numpy(dtype=bool, na_value=False)
+        except Exception:
+            # Column names the expression parser rejects: AND plain comparisons into the mask instead
+            for column, operator, value in expression_conditions:
+                mask &= self._compare(df[column], _QUERY_OPS[operator], value)
+        return mask
+    
+    def _compare(self, series: pd.Series, op: str, value: Any) -> np.ndarray:
+        """Compare a column with a scalar into a boolean array; categoricals compare each category once."""
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes = series.cat.codes.to_numpy()
+            if not len(series.cat.categories):
+                return np.zeros(len(series), dtype=bool)
+            matches = self._compare(pd.Series(np.asarray(series.cat.categories)), op, value)
+            # Missing values only satisfy '!=', as with plain object columns
+            return np.where(codes >= 0, matches[codes], op == '!=')
+        
+        if op == '==':
+            predicate = series == value
+        elif op == '!=':
+            predicate = series != value
+        elif op == '>':
+            predicate = series > value
+        else:
+            predicate = series < value
+        return predicate.to_numpy(dtype=bool, na_value=False)
+    
+    def _contains_mask(self, series: pd.Series, pattern: str) -> Union[pd.Series, np.ndarray]:
+        """Match a regex against a text column with Arrow string kernels, nulls never matching."""
+        if pc is not None:
+            try:
+                arr = pa.array(series, from_pandas=True)
+                if pa.types.is_dictionary(arr.type):
+                    # Categoricals: match each category once, then broadcast through the codes
+                    matches = pc.take(pc.match_substring_regex(arr.dictionary, pattern), arr.indices)
+                else:
+                    matches = pc.match_substring_regex(arr, pattern)
+                return matches.fill_null(False).to_numpy(zero_copy_only=False)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+                # Non-string values or patterns RE2 does not support
+                pass
+        
+        return series.str.contains(pattern, na=False)
+    
+    def _group_kernel_aggregate(self, df: pd.DataFrame, group_by: List[str], functions: Dict) -> Optional[pd.DataFrame]:
+        """Aggregate one numeric column by one key with the compiled group kernels, or return None if not applicable."""
+        if not _HAS_NUMBA or len(group_by) != 1 or len(functions) != 1:
+            return None
+        
+        (column, func), = functions.items()
+        key = group_by[0]
+        if not isinstance(func, str) or func not in _GROUP_KERNEL_REDUCERS or key not in df.columns or column not in df.columns or column == key:
+            return None
+        if df[column].dtype.kind not in 'iuf' or isinstance(df[column].dtype, pd.api.extensions.ExtensionDtype):
+            return None
+        
+        # Sorted codes give groups in the same order as groupby(sort=True); nulls get code -1
+        codes, uniques = pd.factorize(df[key], sort=True)
+        ngroups = len(uniques)
+        values = df[column].to_numpy()
+        wide = values.astype(np.float64 if values.dtype.kind == 'f' else np.int64, copy=False)
+        
+        if func == 'sum':
+            result = _group_sum(codes, wide, ngroups)
+        elif func == 'count':
+            result = _group_count(codes, values, ngroups)
+        elif func == 'mean':
+            with np.errstate(invalid='ignore', divide='ignore'):
+                result = _group_sum(codes, values.astype(np.float64), ngroups) / _group_count(codes, values, ngroups)
+        else:
+            kernel = _group_min if func == 'min' else _group_max
+            result, seen = kernel(codes, values, ngroups)
+            if not seen.all():
+                result = np.where(seen, result, np.nan)
+        
+        return pd.DataFrame({column: result}, index=pd.Index(uniques, name=key))
+    
+    def _use_numba_engine(self, df: pd.DataFrame, functions: Dict) -> bool:
+        """Check whether an aggregation can run on the JIT-compiled numba engine."""
+        if not _HAS_NUMBA or self.config.get('aggregationEngine') != 'numba' or not functions:
+            return False
+        
+        for column, funcs in functions.items():
+            if column not in df.columns or not pd.api.types.is_numeric_dtype(df[column].dtype):
+                return False
+            if isinstance(funcs, str):
+                funcs = [funcs]
+            if not isinstance(funcs, (list, tuple)) or not all(func in _NUMBA_REDUCERS for func in funcs):
+                return False
+        
+        return True
+    
+    def _preview(self, df: pd.DataFrame, n: int = 5) -> Dict[str, Any]:
+        """Return the first n rows in columnar form: column names once, then one value list per row."""
+        # itertuples keeps each column's own scalar type; to_numpy would upcast mixed int/float rows
+        return {
+            'columns': list(df.columns),
+            'rows': [list(row) for row in df.head(n).itertuples(index=False, name=None)]
+        }
+    
+    def _split_columns(self, df: pd.DataFrame) -> tuple:
+        """Split column names into numeric and text (object, string, category) columns in one dtype pass."""
+        numeric_cols = []
+        text_cols = []
+        for col, dtype in df.dtypes.items():
+            if dtype.kind in 'iufc':
+                numeric_cols.append(col)
+            elif dtype.kind == 'O':
+                text_cols.append(col)
+        return numeric_cols, text_cols
+    
+    def _get_summary_stats(self, df: pd.DataFrame, null_counts: Optional[pd.Series] = None, duplicate_count: Optional[int] = None) -> Dict[str, Any]:
+        """Get summary statistics for DataFrame, reusing null/duplicate counts when given."""
+        if null_counts is None:
+            null_counts = df.isnull().sum()
+        if duplicate_count is None:
+            duplicate_count = int(df.duplicated().sum())
+        
+        numeric_cols, text_cols = self._split_columns(df)
         return {
             'shape': df.shape,
             'columns': len(df.columns),
-            'numericColumns': len(df.select_dtypes(include=[np.number]).columns),
-            'textColumns': len(df.select_dtypes(include=['object']).columns),
-            'nullValues': int(df.isnull().sum().sum()),
-            'duplicateRows': int(df.duplicated().sum())
+            'numericColumns': len(numeric_cols),
+            'textColumns': len(text_cols),
+            'nullValues': int(null_counts.sum()),
+            'duplicateRows': duplicate_count
         }
     
-    def _log(self, message: str) -> None:
-        """Add message to logs."""
+    def _log(self, message: str, *args: Any) -> None:
+        """Add message to logs, %-formatting args only when logging is enabled."""
+        if not self._log_enabled:
+            return
+        if args:
+            message = message % args
         self.logs.append(message)
-        if self.config.get('logLevel') in ['debug', 'info']:
-            print(f'[DataProcessing] {message}', file=sys.stderr)
+        print(f'[DataProcessing] {message}', file=sys.stderr)
 
 
 # For DevFlow runtime compatibility